@@ -75,6 +75,15 @@ if ($LASTEXITCODE -ne 0) {
 }
 Write-Host "opengolfcoach installed"
 
+# Install orjson (optional - faster JSON parsing, the plugin falls back to json)
+Write-Host "`nInstalling orjson..." -ForegroundColor Yellow
+& $pythonExe -m pip install orjson --no-warn-script-location
+if ($LASTEXITCODE -ne 0) {
+    Write-Warning "Failed to install orjson - continuing with the standard json module"
+} else {
+    Write-Host "orjson installed"
+}
+
 # Create scripts subdirectory for the plugin
 $scriptsDir = Join-Path $OutputDir "scripts"
 New-Item -ItemType Directory -Force -Path $scriptsDir | Out-Null
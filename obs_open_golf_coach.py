@@ -15,10 +15,14 @@ License: MIT
 
 import obspython as obs
 import json
+import queue
+import re
 import socket
+import selectors
 import threading
-import queue
-from typing import Optional, Dict, Any
+import time
+from collections import deque
+from typing import Optional, Dict, Any, Tuple
 
 # =============================================================================
 # Configuration
@@ -28,14 +32,35 @@ DEFAULT_PORT = 921  # OpenAPI port that Nova connects to
 DEFAULT_HOST = "0.0.0.0"
 SOURCE_PREFIX = "OGC_"
 OPENAPI_HANDSHAKE = '{"Code":201,"GameId":"OpenGolfCoach"}'
+UPDATE_INTERVAL_MS = 16  # main-thread check for new shots, ~one frame at 60 fps
+CLIENT_RCVBUF_SIZE = 262144  # receive buffer for each Nova connection, in bytes
+CLIENT_BUFFER_SIZE = 65536  # initial parse buffer per connection; grows for larger messages
+MISSING_SOURCE_RETRY_S = 5.0  # how often to look again for a source that doesn't exist
 
 # Try to import opengolfcoach for calculations
 try:
     import opengolfcoach
+    _calculate_derived_values = opengolfcoach.calculate_derived_values
     HAS_OGC = True
 except ImportError:
     HAS_OGC = False
 
+# Use orjson for faster JSON handling of shot data when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _json_loads(data):
+        # json.loads can't read memoryviews - copy those out first
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    _json_dumps = json.dumps
+
 # Data point definitions: (json_path, display_name, format_string, unit)
 DATA_POINTS = {
     # Input metrics (Imperial)
@@ -75,6 +100,74 @@ DATA_POINTS = {
     "shot_rank": ("open_golf_coach.shot_rank", "Grade", "{}", ""),
 }
 
+_KEYS = tuple(DATA_POINTS)
+
+# Pre-split json paths so per-shot lookups don't re-split the dotted string
+_PATH_KEYS = {key: tuple(path.split('.')) for key, (path, _, _, _) in DATA_POINTS.items()}
+
+def _compile_accessor(keys: Tuple[str, ...]):
+    """Build a lookup function with the key path inlined, e.g.
+    d['open_golf_coach']['smash_factor'] inside a try block.
+
+    Returns None when a level is missing or isn't a dict."""
+    path = "".join(f"[{key!r}]" for key in keys)
+    namespace: Dict[str, Any] = {}
+    exec(
+        "def accessor(d):\n"
+        "    try:\n"
+        f"        return d{path}\n"
+        "    except (KeyError, TypeError):\n"
+        "        return None\n",
+        namespace,
+    )
+    return namespace["accessor"]
+
+# One compiled accessor per data point, built once at import
+_ACCESSORS = {key: _compile_accessor(keys) for key, keys in _PATH_KEYS.items()}
+
+_SOURCE_NAMES = {key: f"{SOURCE_PREFIX}{key}" for key in DATA_POINTS}
+SUMMARY_KEY = "summary"  # single multiline source used in summary mode
+_SOURCE_NAMES[SUMMARY_KEY] = f"{SOURCE_PREFIX}{SUMMARY_KEY}"
+
+# Single-field str.format specs that have a %-format equivalent, e.g. "{:+.1f}"
+_PERCENT_SPEC = re.compile(r"\{(?::([-+ ]?(?:\.\d+)?f))?\}")
+
+def _compile_formatter(fmt: str, prefix: str, suffix: str):
+    """Build a callable producing a data point's full display text from its value."""
+    # Bake the label and unit into one format so a single call builds the
+    # text, using the cheaper %-formatting where the spec allows it
+    match = _PERCENT_SPEC.fullmatch(fmt)
+    if match:
+        escape = lambda text: text.replace("%", "%%")
+        template = escape(prefix) + "%" + (match.group(1) or "s") + escape(suffix)
+        fmt_text = lambda value: template % (value,)
+    else:
+        escape = lambda text: text.replace("{", "{{").replace("}", "}}")
+        fmt_text = (escape(prefix) + fmt + escape(suffix)).format
+
+    def formatter(value) -> str:
+        try:
+            return fmt_text(value)
+        except (ValueError, TypeError):
+            return prefix + str(value) + suffix
+
+    return formatter
+
+def build_formatters(show_labels: bool, show_units: bool):
+    """Precompile each data point's formatter for the current label/unit settings."""
+    return {
+        key: _compile_formatter(
+            fmt,
+            f"{label}: " if show_labels else "",
+            f" {unit}" if show_units and unit else "",
+        )
+        for key, (_, label, fmt, unit) in DATA_POINTS.items()
+    }
+
+def build_update_specs(enabled_keys: Tuple[str, ...], formatters: Dict[str, Any]):
+    """Resolve the (key, accessor, formatter) of each enabled data point for updates."""
+    return tuple((key, _ACCESSORS[key], formatters[key]) for key in enabled_keys)
+
 # Dashboard grid layout: each key maps to {"x", "y", "w", "h"}
 # 6 rows, standard cell 260w x 100h, gap 10px, x starts at 155px
 DASHBOARD_LAYOUT = {
@@ -106,6 +199,8 @@ DASHBOARD_LAYOUT = {
     "club_path":              {"x": 155,  "y": 620, "w": 260, "h": 100},
     "face_to_target":         {"x": 425,  "y": 620, "w": 260, "h": 100},
     "face_to_path":           {"x": 695,  "y": 620, "w": 260, "h": 100},
+    # Summary mode: one source listing every enabled data point
+    SUMMARY_KEY:              {"x": 155,  "y": 20, "w": 800, "h": 1040, "align": "left"},
 }
 
 CATEGORY_HEADERS = [
@@ -124,15 +219,34 @@ class PluginState:
     def __init__(self):
         self.server_thread: Optional[threading.Thread] = None
         self.server_socket: Optional[socket.socket] = None
+        # Runs the shot calculations so the server thread keeps reading
+        self.shot_worker: Optional[threading.Thread] = None
+        # Nova messages waiting for the shot worker, in arrival order
+        self.shot_messages: Optional[queue.SimpleQueue] = None
+        # Socket pair used to wake the server selector on shutdown
+        self.wake_r: Optional[socket.socket] = None
+        self.wake_w: Optional[socket.socket] = None
         self.running: bool = False
-        self.data_queue: queue.Queue = queue.Queue()
+        # Single slot holding the newest unrendered shot; append and pop are
+        # atomic, so the network thread and OBS timer need no lock
+        self.latest_shot: deque = deque(maxlen=1)
         self.current_data: Dict[str, Any] = {}
-        self.enabled_sources: Dict[str, bool] = {key: True for key in DATA_POINTS.keys()}
+        self.enabled_sources: Dict[str, bool] = {key: True for key in _KEYS}
+        self.enabled_keys: Tuple[str, ...] = _KEYS  # rebuilt from enabled_sources on config change
         self.port: int = DEFAULT_PORT
         self.host: str = DEFAULT_HOST
         self.show_units: bool = True
         self.show_labels: bool = True
+        self.verbose_logging: bool = False  # per-shot log lines
+        self.use_summary_source: bool = False  # one multiline source instead of the grid
+        self.formatters = build_formatters(self.show_labels, self.show_units)
+        self.update_specs = build_update_specs(self.enabled_keys, self.formatters)
         self.created_sources: set = set()
+        self.last_formatted: Dict[str, str] = {}  # last text pushed to each source
+        self.last_values: Dict[str, Any] = {}  # last raw value shown per data point
+        self.source_refs: Dict[str, Any] = {}  # owned obs_source references by name
+        self.missing_sources: Dict[str, float] = {}  # name -> when a lookup last failed
+        self.update_settings = None  # one obs_data reused for every text update
 
 state = PluginState()
 
@@ -140,58 +254,48 @@ state = PluginState()
 # OpenAPI Protocol Handling
 # =============================================================================
 
+MPH_TO_MPS = 0.44704
+
+# OpenAPI -> OGC field mapping per message section: (openapi_key, ogc_key, is_speed)
+# Speeds arrive in mph when Nova is set to imperial units
+OPENAPI_FIELDS = (
+    ("BallData", (
+        ("Speed", "ball_speed_meters_per_second", True),
+        ("VLA", "vertical_launch_angle_degrees", False),
+        ("HLA", "horizontal_launch_angle_degrees", False),
+        ("TotalSpin", "total_spin_rpm", False),
+        ("SpinAxis", "spin_axis_degrees", False),
+        ("BackSpin", "backspin_rpm", False),
+        ("SideSpin", "sidespin_rpm", False),
+    )),
+    ("ClubData", (
+        ("Speed", "club_speed_meters_per_second", True),
+    )),
+)
+
+# Known Units values, checked before falling back to a substring scan
+IMPERIAL_UNITS = frozenset(("Yards", "MPH"))
+METRIC_UNITS = frozenset(("Meters",))
+
+def is_imperial_units(units: str) -> bool:
+    if units in IMPERIAL_UNITS:
+        return True
+    if units in METRIC_UNITS:
+        return False
+    return "Yards" in units or "MPH" in units
+
 def convert_openapi_to_ogc(openapi_data: dict) -> dict:
     """Convert OpenAPI format (from Nova) to Open Golf Coach format."""
     ogc_input = {}
 
-    ball_data = openapi_data.get("BallData", {})
-    units = openapi_data.get("Units", "Yards")
-    is_imperial = "Yards" in units or "MPH" in units
-
-    # Speed -> ball_speed_meters_per_second
-    speed = ball_data.get("Speed")
-    if speed is not None:
-        if is_imperial:
-            ogc_input["ball_speed_meters_per_second"] = speed * 0.44704
-        else:
-            ogc_input["ball_speed_meters_per_second"] = speed
-
-    # VLA -> vertical_launch_angle_degrees
-    vla = ball_data.get("VLA")
-    if vla is not None:
-        ogc_input["vertical_launch_angle_degrees"] = vla
-
-    # HLA -> horizontal_launch_angle_degrees
-    hla = ball_data.get("HLA")
-    if hla is not None:
-        ogc_input["horizontal_launch_angle_degrees"] = hla
-
-    # TotalSpin -> total_spin_rpm
-    total_spin = ball_data.get("TotalSpin")
-    if total_spin is not None:
-        ogc_input["total_spin_rpm"] = total_spin
-
-    # SpinAxis -> spin_axis_degrees
-    spin_axis = ball_data.get("SpinAxis")
-    if spin_axis is not None:
-        ogc_input["spin_axis_degrees"] = spin_axis
-
-    # BackSpin and SideSpin if provided
-    backspin = ball_data.get("BackSpin")
-    sidespin = ball_data.get("SideSpin")
-    if backspin is not None:
-        ogc_input["backspin_rpm"] = backspin
-    if sidespin is not None:
-        ogc_input["sidespin_rpm"] = sidespin
-
-    # ClubData -> clubhead_speed_meters_per_second
-    club_data = openapi_data.get("ClubData", {})
-    club_speed = club_data.get("Speed")
-    if club_speed is not None:
-        if is_imperial:
-            ogc_input["club_speed_meters_per_second"] = club_speed * 0.44704
-        else:
-            ogc_input["club_speed_meters_per_second"] = club_speed
+    is_imperial = is_imperial_units(openapi_data.get("Units", "Yards"))
+
+    for section, fields in OPENAPI_FIELDS:
+        section_data = openapi_data.get(section, {})
+        for openapi_key, ogc_key, is_speed in fields:
+            value = section_data.get(openapi_key)
+            if value is not None:
+                ogc_input[ogc_key] = value * MPH_TO_MPS if is_speed and is_imperial else value
 
     return ogc_input
 
@@ -200,7 +304,8 @@ def process_shot(openapi_data: dict) -> Optional[dict]:
     # Check if this is OpenAPI format (has BallData) or already OGC format
     if "BallData" in openapi_data:
         ogc_input = convert_openapi_to_ogc(openapi_data)
-        obs.script_log(obs.LOG_INFO, f"Converted OpenAPI data: speed={ogc_input.get('ball_speed_meters_per_second', 'N/A')}")
+        if state.verbose_logging:
+            obs.script_log(obs.LOG_INFO, f"Converted OpenAPI data: speed={ogc_input.get('ball_speed_meters_per_second', 'N/A')}")
     elif "open_golf_coach" in openapi_data:
         # Already processed, return as-is
         return openapi_data
@@ -213,86 +318,43 @@ def process_shot(openapi_data: dict) -> Optional[dict]:
     # Calculate derived values using opengolfcoach library
     if HAS_OGC:
         try:
-            result_json = opengolfcoach.calculate_derived_values(json.dumps(ogc_input))
-            result = json.loads(result_json)
-            obs.script_log(obs.LOG_INFO, f"Calculated: {result.get('open_golf_coach', {}).get('shot_name', 'N/A')}")
+            # The library only takes and returns JSON strings
+            result_json = _calculate_derived_values(_json_dumps(ogc_input))
+            result = _json_loads(result_json)
+            if state.verbose_logging:
+                obs.script_log(obs.LOG_INFO, f"Calculated: {result.get('open_golf_coach', {}).get('shot_name', 'N/A')}")
             return result
         except Exception as e:
             obs.script_log(obs.LOG_WARNING, f"OGC calculation error: {e}")
             return ogc_input
     else:
-        obs.script_log(obs.LOG_WARNING, "opengolfcoach not installed - showing raw data only")
+        # Already warned at load time; only repeat it per shot when asked to
+        if state.verbose_logging:
+            obs.script_log(obs.LOG_WARNING, "opengolfcoach not installed - showing raw data only")
         return ogc_input
 
-# =============================================================================
-# JSON Data Extraction
-# =============================================================================
-
-def get_nested_value(data: dict, path: str) -> Any:
-    """Extract a value from nested dict using dot notation path."""
-    keys = path.split('.')
-    value = data
-    for key in keys:
-        if isinstance(value, dict) and key in value:
-            value = value[key]
-        else:
-            return None
-    return value
-
-def format_data_point(key: str, data: dict) -> Optional[str]:
-    """Format a data point for display."""
-    if key not in DATA_POINTS:
-        return None
-
-    json_path, label, fmt, unit = DATA_POINTS[key]
-    value = get_nested_value(data, json_path)
-
-    if value is None:
-        return None
-
-    try:
-        formatted_value = fmt.format(value)
-    except (ValueError, TypeError):
-        formatted_value = str(value)
-
-    parts = []
-    if state.show_labels:
-        parts.append(f"{label}:")
-    parts.append(formatted_value)
-    if state.show_units and unit:
-        parts.append(unit)
-
-    return " ".join(parts)
-
 # =============================================================================
 # OBS Source Management
 # =============================================================================
 
 def get_source_name(key: str) -> str:
-    return f"{SOURCE_PREFIX}{key}"
+    return _SOURCE_NAMES[key]
+
+def create_text_source(key: str, scene, existing: Dict[str, Any], initial_text: str = "---") -> bool:
+    """Create a text source and add it to the given scene.
 
-def create_text_source(key: str, initial_text: str = "---") -> bool:
-    """Create a text source and add it to the current scene."""
+    `existing` maps the names of sources already in OBS to their (borrowed)
+    source, as listed by create_all_sources.
+    """
     source_name = get_source_name(key)
 
-    existing_source = obs.obs_get_source_by_name(source_name)
+    existing_source = existing.get(source_name)
     if existing_source:
-        obs.obs_source_release(existing_source)
+        cache_source_ref(source_name, obs.obs_source_get_ref(existing_source))
         obs.script_log(obs.LOG_INFO, f"Source already exists: {source_name}")
         state.created_sources.add(source_name)
         return True
 
-    current_scene = obs.obs_frontend_get_current_scene()
-    if not current_scene:
-        obs.script_log(obs.LOG_WARNING, "No scene available - please select a scene first")
-        return False
-
-    scene = obs.obs_scene_from_source(current_scene)
-    if not scene:
-        obs.obs_source_release(current_scene)
-        obs.script_log(obs.LOG_WARNING, "Could not get scene object")
-        return False
-
     layout = DASHBOARD_LAYOUT[key]
 
     settings = obs.obs_data_create()
@@ -309,7 +371,7 @@ def create_text_source(key: str, initial_text: str = "---") -> bool:
     obs.obs_data_set_bool(settings, "extents_wrap", True)
 
     # Center text in cell
-    obs.obs_data_set_string(settings, "align", "center")
+    obs.obs_data_set_string(settings, "align", layout.get("align", "center"))
     obs.obs_data_set_string(settings, "valign", "center")
 
     font_obj = obs.obs_data_create()
@@ -330,7 +392,6 @@ def create_text_source(key: str, initial_text: str = "---") -> bool:
 
     if not source:
         obs.script_log(obs.LOG_ERROR, f"Failed to create text source: {source_name}")
-        obs.obs_source_release(current_scene)
         return False
 
     scene_item = obs.obs_scene_add(scene, source)
@@ -341,50 +402,97 @@ def create_text_source(key: str, initial_text: str = "---") -> bool:
         obs.obs_sceneitem_set_pos(scene_item, pos)
         obs.script_log(obs.LOG_INFO, f"SUCCESS: Added {source_name} to scene")
         state.created_sources.add(source_name)
+        cache_source_ref(source_name, source)  # keep our reference for updates
     else:
         obs.script_log(obs.LOG_ERROR, f"FAILED: Could not add {source_name} to scene")
+        obs.obs_source_release(source)
 
-    obs.obs_source_release(source)
-    obs.obs_source_release(current_scene)
     return scene_item is not None
 
-def update_text_source(key: str, text: str):
-    source_name = get_source_name(key)
-    source = obs.obs_get_source_by_name(source_name)
-    if source:
-        settings = obs.obs_data_create()
-        obs.obs_data_set_string(settings, "text", text)
-        obs.obs_source_update(source, settings)
-        obs.obs_data_release(settings)
+def cache_source_ref(source_name: str, source):
+    """Take ownership of a source reference so updates skip the name lookup."""
+    old_source = state.source_refs.get(source_name)
+    if old_source:
+        obs.obs_source_release(old_source)
+    state.source_refs[source_name] = source
+
+def release_source_cache():
+    for source in state.source_refs.values():
         obs.obs_source_release(source)
+    state.source_refs.clear()
+    if state.update_settings:
+        obs.obs_data_release(state.update_settings)
+        state.update_settings = None
+
+def update_text_source(key: str, text: str) -> bool:
+    """Set a data point's text. Returns False if its source isn't available."""
+    source_name = _SOURCE_NAMES[key]
+    source = state.source_refs.get(source_name)
+    if source and obs.obs_source_removed(source):
+        # Deleted in OBS - drop the stale reference and look it up again
+        obs.obs_source_release(source)
+        del state.source_refs[source_name]
+        source = None
+    if not source:
+        # Sources from a saved scene collection are picked up lazily. Names
+        # that aren't found are only looked up again every few seconds.
+        missing_since = state.missing_sources.get(source_name)
+        now = time.monotonic()
+        if missing_since is not None and now - missing_since < MISSING_SOURCE_RETRY_S:
+            return False
+        source = obs.obs_get_source_by_name(source_name)
+        if not source:
+            state.missing_sources[source_name] = now
+            return False
+        state.missing_sources.pop(source_name, None)
+        state.source_refs[source_name] = source
+
+    # obs_source_update applies the settings before returning, so a single
+    # object can be shared by every source
+    settings = state.update_settings
+    if settings is None:
+        settings = state.update_settings = obs.obs_data_create()
+    obs.obs_data_set_string(settings, "text", text)
+    obs.obs_source_update(source, settings)
+    return True
 
-def update_all_sources(data: dict):
-    for key in DATA_POINTS.keys():
-        if not state.enabled_sources.get(key, False):
-            continue
-        formatted = format_data_point(key, data)
-        if formatted:
-            update_text_source(key, formatted)
+def update_all_sources(data: dict) -> bool:
+    """Show a shot on the text sources. Returns False if a source was missing."""
+    last_formatted = state.last_formatted
+    if state.use_summary_source:
+        # One multiline source means one text layout per shot instead of one per data point
+        values = ((accessor(data), formatter) for _, accessor, formatter in state.update_specs)
+        lines = (formatter(value) for value, formatter in values if value is not None)
+        text = "\n".join(line for line in lines if line)
+        if text and text != last_formatted.get(SUMMARY_KEY):
+            if not update_text_source(SUMMARY_KEY, text):
+                return False
+            last_formatted[SUMMARY_KEY] = text
+        return True
 
-def create_category_header(header: dict) -> bool:
-    """Create a category header label source in the current scene."""
+    complete = True
+    last_values = state.last_values
+    for key, accessor, formatter in state.update_specs:
+        value = accessor(data)
+        if value is None or value == last_values.get(key):
+            continue  # unchanged value - skip formatting as well as the update
+        formatted = formatter(value)
+        if formatted and formatted != last_formatted.get(key):
+            if not update_text_source(key, formatted):
+                complete = False
+                continue  # source not there yet - don't cache, so a later shot retries
+            last_formatted[key] = formatted
+        last_values[key] = value
+    return complete
+
+def create_category_header(header: dict, scene, existing: Dict[str, Any]) -> bool:
+    """Create a category header label source in the given scene."""
     source_name = f"{SOURCE_PREFIX}header_{header['name']}"
 
-    existing_source = obs.obs_get_source_by_name(source_name)
-    if existing_source:
-        obs.obs_source_release(existing_source)
+    if source_name in existing:
         state.created_sources.add(source_name)
         return True
 
-    current_scene = obs.obs_frontend_get_current_scene()
-    if not current_scene:
-        return False
-
-    scene = obs.obs_scene_from_source(current_scene)
-    if not scene:
-        obs.obs_source_release(current_scene)
-        return False
-
     settings = obs.obs_data_create()
     obs.obs_data_set_string(settings, "text", header["name"])
 
@@ -420,7 +528,6 @@ def create_category_header(header: dict) -> bool:
     obs.obs_data_release(settings)
 
     if not source:
-        obs.obs_source_release(current_scene)
         return False
 
     scene_item = obs.obs_scene_add(scene, source)
@@ -432,131 +539,246 @@ def create_category_header(header: dict) -> bool:
         state.created_sources.add(source_name)
 
     obs.obs_source_release(source)
-    obs.obs_source_release(current_scene)
     return scene_item is not None
 
 def create_all_sources():
     created_count = 0
+    # (re)created sources need a full refresh, even for a repeated shot
+    state.last_formatted.clear()
+    state.last_values.clear()
+    state.current_data = {}
+    state.missing_sources.clear()
+
+    # Resolve the current scene once for all sources
+    current_scene = obs.obs_frontend_get_current_scene()
+    if not current_scene:
+        obs.script_log(obs.LOG_WARNING, "No scene available - please select a scene first")
+        return created_count
+
+    scene = obs.obs_scene_from_source(current_scene)
+    if not scene:
+        obs.obs_source_release(current_scene)
+        obs.script_log(obs.LOG_WARNING, "Could not get scene object")
+        return created_count
+
+    # List the existing sources once rather than looking up every name
+    sources = obs.obs_enum_sources() or []
+    existing = {obs.obs_source_get_name(source): source for source in sources}
 
-    # Create category headers first
-    for header in CATEGORY_HEADERS:
-        if create_category_header(header):
-            created_count += 1
+    try:
+        if state.use_summary_source:
+            if create_text_source(SUMMARY_KEY, scene, existing, "---"):
+                created_count += 1
+            return created_count
 
-    # Create data sources
-    for key in DATA_POINTS.keys():
-        if state.enabled_sources.get(key, False):
-            if create_text_source(key, "---"):
+        # Create category headers first
+        for header in CATEGORY_HEADERS:
+            if create_category_header(header, scene, existing):
                 created_count += 1
+
+        # Create data sources
+        for key in state.enabled_keys:
+            if create_text_source(key, scene, existing, "---"):
+                created_count += 1
+    finally:
+        obs.source_list_release(sources)
+        obs.obs_source_release(current_scene)
+
     return created_count
 
 # =============================================================================
 # Network Server - OpenAPI Protocol
 # =============================================================================
 
-def handle_client(client_socket: socket.socket, address):
-    """Handle Nova connection with OpenAPI protocol."""
+_HANDSHAKE_BYTES = (OPENAPI_HANDSHAKE + "\n").encode('utf-8')
+
+class NovaClient:
+    """Per-connection state for a Nova client on the server's selector."""
+
+    def __init__(self, client_socket: socket.socket, address):
+        self.socket = client_socket
+        self.address = address
+        # Receive buffer; only the first `end` bytes hold unparsed data
+        self.buffer = bytearray(CLIENT_BUFFER_SIZE)
+        self.end = 0
+
+def accept_client(selector: selectors.BaseSelector):
+    """Accept a Nova connection, send the OpenAPI handshake and start reading."""
+    client_socket, address = state.server_socket.accept()
     obs.script_log(obs.LOG_INFO, f"Nova connected: {address}")
 
     try:
+        # Shots are small and latency-sensitive, so don't let Nagle hold
+        # them back; keepalive lets dead Nova sessions get dropped
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, CLIENT_RCVBUF_SIZE)
+
         # Send OpenAPI handshake immediately
-        handshake = OPENAPI_HANDSHAKE + "\n"
-        client_socket.sendall(handshake.encode('utf-8'))
+        client_socket.sendall(_HANDSHAKE_BYTES)
         obs.script_log(obs.LOG_INFO, f"Sent handshake to {address}")
+    except OSError as e:
+        obs.script_log(obs.LOG_WARNING, f"Client error: {e}")
+        client_socket.close()
+        obs.script_log(obs.LOG_INFO, f"Connection closed: {address}")
+        return
 
-        # Keep connection alive for multiple shots
-        buffer = b""
-        while state.running:
-            try:
-                client_socket.settimeout(1.0)
-                chunk = client_socket.recv(4096)
-            except socket.timeout:
-                continue
-
-            if not chunk:
-                obs.script_log(obs.LOG_INFO, f"Nova disconnected: {address}")
-                break
-
-            buffer += chunk
-
-            # Try to parse complete JSON messages
-            while buffer:
-                # Try to decode and parse
-                try:
-                    text = buffer.decode('utf-8')
-                except UnicodeDecodeError:
-                    break
-
-                text = text.strip()
-                if not text:
-                    buffer = b""
-                    break
+    # Keep connection alive for multiple shots
+    selector.register(client_socket, selectors.EVENT_READ, NovaClient(client_socket, address))
 
-                # Try to parse as JSON
-                try:
-                    data = json.loads(text)
-                    buffer = b""  # Clear buffer on successful parse
-
-                    obs.script_log(obs.LOG_INFO, f"Received shot data from Nova")
-
-                    # Process the shot
-                    processed = process_shot(data)
-                    if processed:
-                        state.data_queue.put(processed)
-
-                except json.JSONDecodeError:
-                    # Check for newline-delimited messages
-                    if b'\n' in buffer:
-                        line, buffer = buffer.split(b'\n', 1)
-                        try:
-                            text = line.decode('utf-8').strip()
-                            if text:
-                                data = json.loads(text)
-                                obs.script_log(obs.LOG_INFO, f"Received shot data from Nova")
-                                processed = process_shot(data)
-                                if processed:
-                                    state.data_queue.put(processed)
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            pass
-                    else:
-                        break  # Wait for more data
+def close_client(selector: selectors.BaseSelector, client: NovaClient):
+    selector.unregister(client.socket)
+    client.socket.close()
+    obs.script_log(obs.LOG_INFO, f"Connection closed: {client.address}")
 
+def read_client(selector: selectors.BaseSelector, client: NovaClient):
+    """Read available data from a Nova connection and handle complete messages."""
+    try:
+        if client.end == len(client.buffer):
+            # Unusually large message - grow the buffer
+            client.buffer.extend(bytes(len(client.buffer)))
+        with memoryview(client.buffer)[client.end:] as free:
+            received = client.socket.recv_into(free)
+        if not received:
+            obs.script_log(obs.LOG_INFO, f"Nova disconnected: {client.address}")
+            close_client(selector, client)
+            return
+        receive_data(client, received)
     except Exception as e:
         obs.script_log(obs.LOG_WARNING, f"Client error: {e}")
-    finally:
-        client_socket.close()
-        obs.script_log(obs.LOG_INFO, f"Connection closed: {address}")
+        close_client(selector, client)
+
+def receive_data(client: NovaClient, received: int):
+    """Handle complete messages after `received` new bytes landed in a client's buffer."""
+    buffer = client.buffer
+    start = client.end
+    end = client.end = start + received
+
+    # Note whether the new data could close an unframed object before
+    # parsing moves it around
+    brace = buffer.rfind(b"}", start, end)
+    may_close = brace >= 0 and not buffer[brace + 1:end].strip()
+
+    # Everything already buffered is newline-free, so only the new
+    # data needs scanning
+    newline = buffer.find(b'\n', start, end)
+
+    # Parse complete newline-delimited messages in place through a
+    # memoryview, then move the remainder to the front in one go
+    pos = 0
+    if newline >= 0:
+        with memoryview(buffer) as view:
+            while newline >= 0:
+                start, pos = pos, newline + 1
+                newline = buffer.find(b'\n', pos, end)
+                with view[start:pos - 1] as line:
+                    try:
+                        data = _json_loads(line)
+                    except ValueError:
+                        continue  # blank or malformed line
+                handle_message(data)
+        buffer[:end - pos] = buffer[pos:end]
+        end = client.end = end - pos
+
+    # Nova may also send messages without a trailing newline. Only
+    # try decoding once the latest data could close an object.
+    if end and may_close:
+        try:
+            text = buffer[:end].decode('utf-8')
+        except UnicodeDecodeError:
+            return  # Split character - wait for more data
+        values, rest = split_json_values(text)
+        if values:
+            rest = rest.encode('utf-8')
+            buffer[:len(rest)] = rest
+            client.end = len(rest)
+            for data in values:
+                handle_message(data)
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+def split_json_values(text: str):
+    """Decode JSON values from the front of unframed text.
+
+    Returns the decoded values and the remaining text, which is empty or
+    holds an incomplete value still waiting for more data.
+    """
+    values = []
+    idx = _WHITESPACE.match(text).end()
+    while idx < len(text):
+        try:
+            value, idx = _DECODER.raw_decode(text, idx)
+        except json.JSONDecodeError:
+            break
+        values.append(value)
+        idx = _WHITESPACE.match(text, idx).end()
+    return values, text[idx:]
+
+def handle_message(data: dict):
+    """Hand one parsed message from Nova to the shot worker."""
+    if state.verbose_logging:
+        obs.script_log(obs.LOG_INFO, "Received shot data from Nova")
+    messages = state.shot_messages
+    if messages is not None:
+        messages.put(data)
+
+def shot_worker_func(messages: queue.SimpleQueue):
+    """Shot worker thread: process Nova messages in order and queue the results."""
+    while True:
+        data = messages.get()
+        if data is None:  # stop sentinel from stop_server
+            return
+        try:
+            processed = process_shot(data)
+        except Exception as e:
+            obs.script_log(obs.LOG_WARNING, f"Shot processing error: {e}")
+            continue
+        if processed:
+            queue_shot(processed)
+
+def queue_shot(data: dict):
+    """Hand processed shot data to the OBS main thread.
+
+    Only the newest shot is kept: a shot the main thread hasn't rendered yet
+    is replaced, since it would never be displayed anyway.
+    """
+    state.latest_shot.append(data)
 
 def server_thread_func():
-    """Main server thread."""
+    """Main server thread: one selector loop serving all Nova connections."""
     obs.script_log(obs.LOG_INFO, f"Starting OpenAPI server on port {state.port}")
 
+    selector = selectors.DefaultSelector()
+
     try:
         state.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         state.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         state.server_socket.bind((state.host, state.port))
         state.server_socket.listen(5)
-        state.server_socket.settimeout(1.0)
+        selector.register(state.server_socket, selectors.EVENT_READ)
+        selector.register(state.wake_r, selectors.EVENT_READ)
 
         obs.script_log(obs.LOG_INFO, f"Waiting for Nova on port {state.port}...")
 
         while state.running:
-            try:
-                client_socket, address = state.server_socket.accept()
-                client_thread = threading.Thread(
-                    target=handle_client,
-                    args=(client_socket, address),
-                    daemon=True
-                )
-                client_thread.start()
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if state.running:
-                    obs.script_log(obs.LOG_WARNING, f"Accept error: {e}")
+            for key, _ in selector.select():
+                if not state.running:
+                    break
+                if isinstance(key.data, NovaClient):
+                    read_client(selector, key.data)
+                elif key.fileobj is state.server_socket:
+                    try:
+                        accept_client(selector)
+                    except Exception as e:
+                        obs.script_log(obs.LOG_WARNING, f"Accept error: {e}")
     except Exception as e:
         obs.script_log(obs.LOG_ERROR, f"Server error: {e}")
     finally:
+        for key in list(selector.get_map().values()):
+            if isinstance(key.data, NovaClient):
+                close_client(selector, key.data)
+        selector.close()
         if state.server_socket:
             state.server_socket.close()
             state.server_socket = None
@@ -566,19 +788,38 @@ def start_server():
     if state.running:
         return
     state.running = True
+    state.wake_r, state.wake_w = socket.socketpair()
+    state.shot_messages = queue.SimpleQueue()
+    # A single worker converts every message in arrival order; only finished
+    # shots are conflated, in latest_shot
+    state.shot_worker = threading.Thread(target=shot_worker_func, args=(state.shot_messages,),
+                                         name="ogc-shot", daemon=True)
+    state.shot_worker.start()
     state.server_thread = threading.Thread(target=server_thread_func, daemon=True)
     state.server_thread.start()
 
 def stop_server():
     state.running = False
-    if state.server_socket:
+    if state.wake_w:
+        # Wake the server selector so it sees running=False
         try:
-            state.server_socket.close()
-        except:
+            state.wake_w.send(b"\0")
+        except OSError:
             pass
     if state.server_thread:
         state.server_thread.join(timeout=2.0)
         state.server_thread = None
+    if state.shot_messages is not None:
+        # Stop the shot worker once it has drained the messages before this
+        state.shot_messages.put(None)
+        state.shot_messages = None
+    if state.shot_worker:
+        state.shot_worker.join(timeout=2.0)
+        state.shot_worker = None
+    if state.wake_r:
+        state.wake_r.close()
+        state.wake_w.close()
+        state.wake_r = state.wake_w = None
 
 # =============================================================================
 # OBS Script Interface
@@ -603,6 +844,8 @@ def script_properties():
     obs.obs_properties_add_int(props, "port", "Listening Port (for Nova)", 1, 65535, 1)
     obs.obs_properties_add_bool(props, "show_labels", "Show Labels")
     obs.obs_properties_add_bool(props, "show_units", "Show Units")
+    obs.obs_properties_add_bool(props, "verbose_logging", "Verbose Logging (every shot)")
+    obs.obs_properties_add_bool(props, "use_summary_source", "Single Summary Source (instead of grid)")
 
     obs.obs_properties_add_bool(props, "enable_ball_speed", "Ball Speed")
     obs.obs_properties_add_bool(props, "enable_clubhead_speed", "Clubhead Speed")
@@ -636,16 +879,26 @@ def script_defaults(settings):
     obs.obs_data_set_default_int(settings, "port", DEFAULT_PORT)
     obs.obs_data_set_default_bool(settings, "show_labels", True)
     obs.obs_data_set_default_bool(settings, "show_units", True)
-    for key in DATA_POINTS.keys():
+    obs.obs_data_set_default_bool(settings, "verbose_logging", False)
+    obs.obs_data_set_default_bool(settings, "use_summary_source", False)
+    for key in _KEYS:
         obs.obs_data_set_default_bool(settings, f"enable_{key}", True)
 
 def script_update(settings):
     new_port = obs.obs_data_get_int(settings, "port")
     state.show_labels = obs.obs_data_get_bool(settings, "show_labels")
     state.show_units = obs.obs_data_get_bool(settings, "show_units")
-
-    for key in DATA_POINTS.keys():
+    state.verbose_logging = obs.obs_data_get_bool(settings, "verbose_logging")
+    state.use_summary_source = obs.obs_data_get_bool(settings, "use_summary_source")
+    state.formatters = build_formatters(state.show_labels, state.show_units)
+    # Redraw the next shot with the new settings
+    state.last_values.clear()
+    state.current_data = {}
+
+    for key in _KEYS:
         state.enabled_sources[key] = obs.obs_data_get_bool(settings, f"enable_{key}")
+    state.enabled_keys = tuple(key for key in _KEYS if state.enabled_sources[key])
+    state.update_specs = build_update_specs(state.enabled_keys, state.formatters)
 
     if new_port != state.port:
         state.port = new_port
@@ -661,11 +914,12 @@ def script_load(settings):
         obs.script_log(obs.LOG_WARNING, "opengolfcoach NOT installed - pip install opengolfcoach")
     script_update(settings)
     start_server()
-    obs.timer_add(process_data_queue, 100)
+    obs.timer_add(process_data_queue, UPDATE_INTERVAL_MS)
 
 def script_unload():
     obs.timer_remove(process_data_queue)
     stop_server()
+    release_source_cache()
     obs.script_log(obs.LOG_INFO, "Open Golf Coach Plugin unloaded")
 
 # =============================================================================
@@ -673,11 +927,21 @@ def script_unload():
 # =============================================================================
 
 def process_data_queue():
+    # Cheap exit on idle ticks
+    if not state.latest_shot:
+        return
+    try:
+        data = state.latest_shot.pop()
+    except IndexError:
+        return
+    # Nova can resend the same shot - nothing would change on screen, unless
+    # a source was missing last time, so that shot is only remembered once
+    # every source has shown it
+    if data == state.current_data:
+        return
     try:
-        while not state.data_queue.empty():
-            data = state.data_queue.get_nowait()
+        if update_all_sources(data):
             state.current_data = data
-            update_all_sources(data)
     except:
         pass
 
@@ -724,6 +988,6 @@ def send_test_data_clicked(props, prop):
             }
         }
     }
-    state.data_queue.put(test_data)
+    queue_shot(test_data)
     obs.script_log(obs.LOG_INFO, "Test data queued")
     return True
@@ -8,51 +8,136 @@ Usage:
     python test_sender.py --direct             # Send directly to OBS plugin (port 9211)
     python test_sender.py --continuous         # Send shots every 5 seconds
     python test_sender.py --port 921           # Specify custom port
+    python test_sender.py --continuous --conflate  # Skip stale shots if sending falls behind
+    python test_sender.py --continuous --interval 0.01 --batch-ms 50  # Coalesce fast shots
 """
 
 import socket
-import json
+import select
 import argparse
 import time
 import random
+import queue
+import threading
+from collections import deque
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
 
 OPENAPI_PORT = 921    # OpenAPI service port
 OBS_PORT = 9211       # Direct to OBS plugin port
+SEND_BUFFER_SIZE = 65536  # Socket send buffer, plenty for a run of small shot lines
+BATCH_MAX_BYTES = 8192    # Flush a --batch-ms batch early once it reaches this size
 
-def generate_openapi_shot() -> dict:
-    """Generate shot data in OpenAPI format (what Nova sends)."""
-    # Randomize input parameters within realistic ranges
-    ball_speed_mph = random.uniform(100, 175)  # mph
-    clubhead_speed_mph = ball_speed_mph / random.uniform(1.35, 1.55)  # realistic smash factor range
-    launch_angle_v = random.uniform(8, 18)
-    launch_angle_h = random.uniform(-5, 5)
-    total_spin = random.uniform(2000, 4000)
-    spin_axis = random.uniform(-20, 20)
-
-    return {
-        "BallData": {
-            "Speed": round(ball_speed_mph, 1),
-            "VLA": round(launch_angle_v, 1),
-            "HLA": round(launch_angle_h, 1),
-            "TotalSpin": round(total_spin, 0),
-            "SpinAxis": round(spin_axis, 1)
-        },
-        "ClubData": {
-            "Speed": round(clubhead_speed_mph, 1)
-        },
-        "Units": "Yards"
-    }
-
-def generate_ogc_shot() -> dict:
-    """Generate shot data in OGC format with calculated values."""
+# Shot messages have a fixed layout, so they are formatted straight into
+# JSON lines instead of building and encoding a dict per shot. The format
+# specs do the rounding, so callers pass unrounded floats.
+OPENAPI_TEMPLATE = (
+    '{{"BallData": {{"Speed": {speed:.1f}, "VLA": {vla:.1f}, "HLA": {hla:.1f}, '
+    '"TotalSpin": {total_spin:.0f}, "SpinAxis": {spin_axis:.1f}}}, '
+    '"ClubData": {{"Speed": {club_speed:.1f}}}, "Units": "Yards"}}\n'
+)
+OGC_TEMPLATE = (
+    '{{"ball_speed_meters_per_second": {ball_speed:.1f}, '
+    '"club_speed_meters_per_second": {club_speed:.1f}, '
+    '"vertical_launch_angle_degrees": {vla:.1f}, '
+    '"horizontal_launch_angle_degrees": {hla:.1f}, '
+    '"total_spin_rpm": {total_spin:.0f}, '
+    '"spin_axis_degrees": {spin_axis:.1f}, '
+    '"open_golf_coach": {{'
+    '"carry_distance_meters": {carry:.1f}, '
+    '"total_distance_meters": {total:.1f}, '
+    '"offline_distance_meters": {offline:.1f}, '
+    '"peak_height_meters": {peak_height:.1f}, '
+    '"hang_time_seconds": {hang_time:.2f}, '
+    '"backspin_rpm": {backspin:.1f}, '
+    '"sidespin_rpm": {sidespin:.1f}, '
+    '"club_speed_meters_per_second": {club_speed:.1f}, '
+    '"smash_factor": {smash_factor:.2f}, '
+    '"shot_name": "{shot_name}", '
+    '"shot_rank": "{shot_rank}", '
+    '"us_customary_units": {{'
+    '"ball_speed_mph": {ball_speed_mph:.1f}, '
+    '"club_speed_mph": {club_speed_mph:.1f}, '
+    '"carry_distance_yards": {carry_yards:.1f}, '
+    '"total_distance_yards": {total_yards:.1f}, '
+    '"offline_distance_yards": {offline_yards:.1f}, '
+    '"peak_height_yards": {peak_height_yards:.1f}'
+    '}}}}}}\n'
+)
+
+# Private generator with its random() bound once; each range is drawn as
+# low + span * _rand() rather than through random.uniform
+_rng = random.Random()
+_rand = _rng.random
+
+def random_launch(ball_speed_min: float, ball_speed_max: float) -> Tuple[float, ...]:
+    """Draw random launch conditions within realistic ranges.
+
+    Returns (ball_speed, smash_factor, launch_angle_v, launch_angle_h,
+    total_spin, spin_axis), with ball speed in the caller's units.
+    """
+    ball_speed = ball_speed_min + (ball_speed_max - ball_speed_min) * _rand()
+    smash_factor = 1.35 + 0.2 * _rand()  # realistic smash factor range
+    launch_angle_v = 8.0 + 10.0 * _rand()
+    launch_angle_h = -5.0 + 10.0 * _rand()
+    total_spin = 2000.0 + 2000.0 * _rand()
+    spin_axis = -20.0 + 40.0 * _rand()
+    return ball_speed, smash_factor, launch_angle_v, launch_angle_h, total_spin, spin_axis
+
+# Classification thresholds, searched with bisect instead of if/elif chains.
+# A value equal to a threshold falls into the bin above it.
+_DIR_BINS = (-3.0, 3.0)
+_DIR_NAMES = ("Pull", "", "Push")
+_SHAPE_BINS = (-10.0, -3.0, 3.0, 10.0)
+_SHAPE_NAMES = ("Hook", "Draw", "Straight", "Fade", "Slice")
+# Rank is the worse of the offline tier (abs offline < 5 / 10 / 15) and the
+# carry tier (carry > 180 allows S, > 160 allows A, otherwise B at best)
+_OFFLINE_BINS = (5.0, 10.0, 15.0)
+_CARRY_BINS = (160.0, 180.0)
+_RANK_NAMES = ("S", "A", "B", "C")
+
+def classify_shot_name(launch_angle_h: float, spin_axis: float) -> str:
+    """Name the shot from its start direction and curve, e.g. "Push Fade"."""
+    direction = _DIR_NAMES[bisect_right(_DIR_BINS, launch_angle_h)]
+    shape = _SHAPE_NAMES[bisect_right(_SHAPE_BINS, spin_axis)]
+    return f"{direction} {shape}" if direction else shape
+
+def classify_rank(carry: float, offline: float) -> str:
+    """Grade the shot from its carry and offline distance."""
+    offline_tier = bisect_right(_OFFLINE_BINS, abs(offline))
+    carry_tier = 2 - bisect_left(_CARRY_BINS, carry)
+    return _RANK_NAMES[max(offline_tier, carry_tier)]
+
+def generate_openapi_shot() -> Tuple[bytes, str]:
+    """Generate shot data in OpenAPI format (what Nova sends).
+
+    Returns the encoded message line and a summary for printing.
+    """
+    ball_speed_mph, smash_factor, launch_angle_v, launch_angle_h, total_spin, spin_axis = \
+        random_launch(100, 175)
+    clubhead_speed_mph = ball_speed_mph / smash_factor
+
+    message = OPENAPI_TEMPLATE.format(
+        speed=ball_speed_mph,
+        vla=launch_angle_v,
+        hla=launch_angle_h,
+        total_spin=total_spin,
+        spin_axis=spin_axis,
+        club_speed=clubhead_speed_mph,
+    )
+    summary = (f"Ball Speed {ball_speed_mph:.1f} mph, Launch Angle {launch_angle_v:.1f}°, "
+               f"Total Spin {total_spin:.0f} rpm")
+    return message.encode('utf-8'), summary
+
+def generate_ogc_shot() -> Tuple[bytes, str]:
+    """Generate shot data in OGC format with calculated values.
+
+    Returns the encoded message line and a summary for printing.
+    """
     # This simulates what the OpenAPI service would send to OBS
-    ball_speed_mps = random.uniform(50, 80)
-    smash_factor = random.uniform(1.35, 1.55)
+    ball_speed_mps, smash_factor, launch_angle_v, launch_angle_h, total_spin, spin_axis = \
+        random_launch(50, 80)
     club_speed_mps = ball_speed_mps / smash_factor
-    launch_angle_v = random.uniform(8, 18)
-    launch_angle_h = random.uniform(-5, 5)
-    total_spin = random.uniform(2000, 4000)
-    spin_axis = random.uniform(-20, 20)
 
     # Simulate calculated values
     carry = ball_speed_mps * 2.5 + launch_angle_v * 2 - abs(spin_axis) * 0.5
@@ -61,126 +146,179 @@ def generate_ogc_shot() -> dict:
     peak_height = launch_angle_v * 2.2
     hang_time = launch_angle_v * 0.5
 
-    # Determine shot shape
-    if launch_angle_h < -3:
-        direction = "Pull"
-    elif launch_angle_h > 3:
-        direction = "Push"
-    else:
-        direction = ""
-
-    if spin_axis < -10:
-        shape = "Hook"
-    elif spin_axis < -3:
-        shape = "Draw"
-    elif spin_axis > 10:
-        shape = "Slice"
-    elif spin_axis > 3:
-        shape = "Fade"
-    else:
-        shape = "Straight"
-
-    shot_name = f"{direction} {shape}".strip() if direction else shape
+    shot_name = classify_shot_name(launch_angle_h, spin_axis)
+    rank = classify_rank(carry, offline)
 
-    # Determine rank
-    if abs(offline) < 5 and carry > 180:
-        rank = "S"
-    elif abs(offline) < 10 and carry > 160:
-        rank = "A"
-    elif abs(offline) < 15:
-        rank = "B"
-    else:
-        rank = "C"
-
-    return {
-        "ball_speed_meters_per_second": round(ball_speed_mps, 1),
-        "club_speed_meters_per_second": round(club_speed_mps, 1),
-        "vertical_launch_angle_degrees": round(launch_angle_v, 1),
-        "horizontal_launch_angle_degrees": round(launch_angle_h, 1),
-        "total_spin_rpm": round(total_spin, 0),
-        "spin_axis_degrees": round(spin_axis, 1),
-        "open_golf_coach": {
-            "carry_distance_meters": round(carry, 1),
-            "total_distance_meters": round(total, 1),
-            "offline_distance_meters": round(offline, 1),
-            "peak_height_meters": round(peak_height, 1),
-            "hang_time_seconds": round(hang_time, 2),
-            "backspin_rpm": round(total_spin * 0.95, 1),
-            "sidespin_rpm": round(total_spin * spin_axis / 90, 1),
-            "club_speed_meters_per_second": round(club_speed_mps, 1),
-            "smash_factor": round(smash_factor, 2),
-            "shot_name": shot_name,
-            "shot_rank": rank,
-            "us_customary_units": {
-                "ball_speed_mph": round(ball_speed_mps * 2.237, 1),
-                "club_speed_mph": round(club_speed_mps * 2.237, 1),
-                "carry_distance_yards": round(carry * 1.094, 1),
-                "total_distance_yards": round(total * 1.094, 1),
-                "offline_distance_yards": round(offline * 1.094, 1),
-                "peak_height_yards": round(peak_height * 1.094, 1)
-            }
-        }
-    }
-
-def send_to_openapi(host: str, port: int, shot_data: dict) -> bool:
-    """Send OpenAPI format data (simulating Nova)."""
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(5.0)
-            sock.connect((host, port))
+    message = OGC_TEMPLATE.format(
+        ball_speed=ball_speed_mps,
+        club_speed=club_speed_mps,
+        vla=launch_angle_v,
+        hla=launch_angle_h,
+        total_spin=total_spin,
+        spin_axis=spin_axis,
+        carry=carry,
+        total=total,
+        offline=offline,
+        peak_height=peak_height,
+        hang_time=hang_time,
+        backspin=total_spin * 0.95,
+        sidespin=total_spin * spin_axis / 90,
+        smash_factor=smash_factor,
+        shot_name=shot_name,
+        shot_rank=rank,
+        ball_speed_mph=ball_speed_mps * 2.237,
+        club_speed_mph=club_speed_mps * 2.237,
+        carry_yards=carry * 1.094,
+        total_yards=total * 1.094,
+        offline_yards=offline * 1.094,
+        peak_height_yards=peak_height * 1.094,
+    )
+    summary = (f"Ball Speed {ball_speed_mps * 2.237:.1f} mph, Carry {carry * 1.094:.1f} yds, "
+               f"{shot_name} ({rank})")
+    return message.encode('utf-8'), summary
 
-            # Receive handshake
-            handshake = sock.recv(1024).decode('utf-8')
-            print(f"Received handshake: {handshake.strip()}")
+# Scratch buffer for the OpenAPI service's handshake
+_HANDSHAKE_BUF = bytearray(1024)
 
-            # Send shot data
-            message = json.dumps(shot_data) + "\n"
-            sock.sendall(message.encode('utf-8'))
+def connect(host: str, port: int, direct: bool) -> Optional[socket.socket]:
+    """Open a connection that can be reused for several shots.
 
-            ball = shot_data.get("BallData", {})
-            print(f"Sent OpenAPI shot:")
-            print(f"  Ball Speed: {ball.get('Speed', 'N/A')} mph")
-            print(f"  Launch Angle: {ball.get('VLA', 'N/A')}°")
-            print(f"  Total Spin: {ball.get('TotalSpin', 'N/A')} rpm")
-            return True
+    In OpenAPI mode the service's handshake is read right away, the way Nova
+    does after connecting.
+    """
+    try:
+        sock = socket.create_connection((host, port), timeout=5.0)
+        try:
+            # Send each small shot line right away instead of letting Nagle hold it
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+            if not direct:
+                # Receive handshake; its contents are never inspected, so it is
+                # read into a reusable buffer without decoding
+                n = sock.recv_into(_HANDSHAKE_BUF)
+                print(f"Received handshake ({n} bytes)")
+        except BaseException:
+            # Don't leak the socket when setup or the handshake fails
+            sock.close()
+            raise
+        return sock
 
     except ConnectionRefusedError:
         print(f"Error: Could not connect to {host}:{port}")
-        print("Make sure ogc_openapi_service.py is running.")
-        return False
+        if direct:
+            print("Make sure OBS is running with the Open Golf Coach plugin loaded.")
+        else:
+            print("Make sure ogc_openapi_service.py is running.")
+        return None
     except socket.timeout:
         print(f"Error: Connection timed out")
-        return False
+        return None
     except Exception as e:
         print(f"Error: {e}")
-        return False
+        return None
 
-def send_to_obs(host: str, port: int, shot_data: dict) -> bool:
-    """Send OGC format data directly to OBS plugin."""
+def peer_closed(sock: socket.socket) -> bool:
+    """Check, without blocking, whether the other end closed the connection."""
+    readable, _, _ = select.select([sock], [], [], 0)
+    if not readable:
+        return False
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(5.0)
-            sock.connect((host, port))
+        return not sock.recv(1, socket.MSG_PEEK)
+    except OSError:
+        return True
 
-            message = json.dumps(shot_data) + "\n"
-            sock.sendall(message.encode('utf-8'))
+def generate_shot(direct: bool) -> Tuple[bytes, str]:
+    return generate_ogc_shot() if direct else generate_openapi_shot()
 
-            ogc = shot_data.get("open_golf_coach", {})
-            us = ogc.get("us_customary_units", {})
-            print(f"Sent to OBS:")
-            print(f"  Ball Speed: {us.get('ball_speed_mph', 'N/A')} mph")
-            print(f"  Carry: {us.get('carry_distance_yards', 'N/A')} yds")
-            print(f"  Shot: {ogc.get('shot_name', 'N/A')} ({ogc.get('shot_rank', 'N/A')})")
-            return True
+# Reused to join batched shot lines into a single write
+_BATCH_BUF = bytearray()
 
-    except ConnectionRefusedError:
-        print(f"Error: Could not connect to {host}:{port}")
-        print("Make sure OBS is running with the Open Golf Coach plugin loaded.")
-        return False
+def send_shots(sock: socket.socket, batch: List[Tuple[str, Tuple[bytes, str]]]) -> bool:
+    """Send labelled shots in one write and print one summary line per shot."""
+    if len(batch) == 1:
+        data = batch[0][1][0]
+    else:
+        _BATCH_BUF.clear()
+        for _, (message, _) in batch:
+            _BATCH_BUF.extend(message)
+        data = _BATCH_BUF
+    try:
+        sock.sendall(data)
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"{', '.join(label for label, _ in batch)}: Error: {e}")
         return False
 
+    for label, (_, summary) in batch:
+        print(f"{label}: {summary}")
+    return True
+
+def next_batch(shots, batch_s: float) -> List[Tuple[str, Tuple[bytes, str]]]:
+    """Wait for the next shot, then gather any more that arrive within batch_s.
+
+    Raises queue.Empty if no shot arrives within the poll timeout.
+    """
+    # Wake periodically so Ctrl+C is handled on every platform
+    batch = [shots.get(timeout=0.5)]
+    if batch_s > 0:
+        deadline = time.monotonic() + batch_s
+        size = len(batch[0][1][0])
+        while size < BATCH_MAX_BYTES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = shots.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            size += len(item[1][0])
+    return batch
+
+class LatestShot:
+    """Single-slot shot queue that keeps only the newest shot.
+
+    Same put/get interface as queue.Queue, but put never blocks: an unsent
+    shot is replaced by the next one.
+    """
+
+    def __init__(self):
+        self._slot = deque(maxlen=1)
+        self._ready = threading.Condition()
+
+    def put(self, item):
+        with self._ready:
+            self._slot.append(item)
+            self._ready.notify()
+
+    def get(self, timeout: Optional[float] = None):
+        with self._ready:
+            if not self._ready.wait_for(lambda: self._slot, timeout):
+                raise queue.Empty
+            return self._slot.popleft()
+
+def produce_shots(shots, direct: bool, interval: float, stop: threading.Event):
+    """Generate labelled shots on a fixed schedule and hand them to the sender."""
+    # Bind everything the loop calls to locals once, outside the loop
+    generate = generate_ogc_shot if direct else generate_openapi_shot
+    put = shots.put
+    stopped = stop.is_set
+    wait = stop.wait
+    monotonic = time.monotonic
+
+    shot_count = 0
+    # Shots are scheduled on fixed deadlines so generation time doesn't add drift
+    next_shot = monotonic()
+    while not stopped():
+        shot_count += 1
+        put((f"Shot #{shot_count}", generate()))
+
+        next_shot += interval
+        delay = next_shot - monotonic()
+        if delay > 0:
+            wait(delay)
+        else:
+            next_shot = monotonic()  # fell behind - don't burst to catch up
+
 def main():
     parser = argparse.ArgumentParser(description="Send test golf shot data")
     parser.add_argument("--host", default="127.0.0.1", help="Host address")
@@ -191,6 +329,11 @@ def main():
                         help="Send shots continuously")
     parser.add_argument("--interval", type=float, default=5.0,
                         help="Interval between shots in continuous mode (default: 5s)")
+    parser.add_argument("--conflate", action="store_true",
+                        help="In continuous mode, send only the newest shot if sending falls behind")
+    parser.add_argument("--batch-ms", type=float, default=0.0,
+                        help="In continuous mode, send shots generated within this many "
+                             "milliseconds in one write (default: 0, send each shot on its own)")
 
     args = parser.parse_args()
 
@@ -210,29 +353,51 @@ def main():
         print(f"Continuous mode: sending every {args.interval}s")
         print("Press Ctrl+C to stop")
         print("-" * 40)
+        # Shots are generated on a separate thread so the next one is ready
+        # while the current one is being sent. The bounded queue holds the
+        # generator back if sending stalls; --conflate drops stale shots instead.
+        shots = LatestShot() if args.conflate else queue.Queue(maxsize=4)
+        stop = threading.Event()
+        producer = threading.Thread(target=produce_shots,
+                                    args=(shots, args.direct, args.interval, stop),
+                                    daemon=True)
+        producer.start()
+        batch_s = args.batch_ms / 1000.0
+        host, direct = args.host, args.direct
         shot_count = 0
+        # One connection is kept open across shots, like Nova does
+        sock = None
         try:
             while True:
-                shot_count += 1
-                print(f"\nShot #{shot_count}")
+                try:
+                    batch = next_batch(shots, batch_s)
+                except queue.Empty:
+                    continue
+                shot_count += len(batch)
 
-                if args.direct:
-                    shot_data = generate_ogc_shot()
-                    send_to_obs(args.host, port, shot_data)
-                else:
-                    shot_data = generate_openapi_shot()
-                    send_to_openapi(args.host, port, shot_data)
-
-                time.sleep(args.interval)
+                if sock is not None and peer_closed(sock):
+                    sock.close()
+                    sock = None
+                if sock is None:
+                    sock = connect(host, port, direct)
+                if sock is not None and not send_shots(sock, batch):
+                    # Connection dropped - reconnect and retry once
+                    sock.close()
+                    sock = connect(host, port, direct)
+                    if sock is not None and not send_shots(sock, batch):
+                        sock.close()
+                        sock = None
         except KeyboardInterrupt:
             print(f"\nStopped after {shot_count} shots")
+        finally:
+            stop.set()
+            if sock is not None:
+                sock.close()
     else:
-        if args.direct:
-            shot_data = generate_ogc_shot()
-            send_to_obs(args.host, port, shot_data)
-        else:
-            shot_data = generate_openapi_shot()
-            send_to_openapi(args.host, port, shot_data)
+        sock = connect(args.host, port, args.direct)
+        if sock is not None:
+            with sock:
+                send_shots(sock, [("Sent", generate_shot(args.direct))])
 
 if __name__ == "__main__":
     main()